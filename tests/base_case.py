@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 
 import pytest
@@ -9,32 +8,30 @@ class BaseCase:
     """Base mixin class for all tests.
 
     For testing we use pytest in combination with unittest TestCases.
-    We also use pytest-mock to mock external dependencies and pytest-datadir to
-    provide test data.
+    We also use pytest-mock to mock external dependencies. Test data is read
+    directly from tests/data, which tests must not modify.
 
     Links:
         https://docs.pytest.org/
         https://docs.pytest.org/en/latest/unittest.html
         https://pypi.org/project/pytest-mock/
-        https://pypi.org/project/pytest-datadir/
     """
 
     mocker: MockerFixture
-    shared_datadir: Path
+    data_dir: Path
     default_settings: dict
 
     @pytest.fixture(autouse=True)
-    def __inject_fixtures(self, mocker: MockerFixture, shared_datadir: Path):
+    def __inject_fixtures(
+        self, mocker: MockerFixture, data_dir: Path, default_settings: dict
+    ):
         """Injects fixtures into the test case."""
         # Inject mocker fixture
         self.mocker = mocker
-        # Inject shared data directory fixture
-        self.shared_datadir = shared_datadir
-
-    def setUp(self):
-        """Sets up the test case."""
-        with open(self.shared_datadir / "default_settings.json") as f:
-            self.default_settings = json.load(f)
+        # Inject the (read-only) test data directory
+        self.data_dir = data_dir
+        # Inject the session-wide default settings
+        self.default_settings = default_settings
 
     def tearDown(self) -> None:
         """Tears down the test case."""
@@ -0,0 +1,40 @@
+import json
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+from censys.cloud_connectors.common.cli import base as cli_base
+from censys.cloud_connectors.common.cli.base import BaseCli
+
+from .utils import DATA_DIR
+
+
+@pytest.fixture(scope="session")
+def data_dir() -> Path:
+    """The tests data directory (shared, so tests must not write to it)."""
+    return DATA_DIR
+
+
+@pytest.fixture(scope="session")
+def default_settings(data_dir: Path) -> dict:
+    """Default settings, parsed once per session (treat as read-only)."""
+    return json.loads((data_dir / "default_settings.json").read_text())
+
+
+@pytest.fixture(scope="session")
+def gcp_responses(data_dir: Path) -> dict:
+    """GCP test responses, parsed once per session (treat as read-only)."""
+    return json.loads((data_dir / "test_gcp_responses.json").read_text())
+
+
+@pytest.fixture(scope="session")
+def base_cli() -> BaseCli:
+    """Shared BaseCli instance (all of its helpers are stateless)."""
+    return BaseCli()
+
+
+@pytest.fixture(scope="session")
+def cli_base_module() -> ModuleType:
+    """The cli base module, for patching its attributes with patch.object."""
+    return cli_base
@@ -35,7 +35,7 @@ class TestAwsConnector(BaseConnectorCase, TestCase):
         super().setUp()
 
         # Note: responses contains a block that stores the credentials
-        with open(self.shared_datadir / "test_aws_responses.json") as f:
+        with open(self.data_dir / "test_aws_responses.json") as f:
             self.data = json.load(f)
 
         test_aws_settings = AwsSpecificSettings.from_dict(self.data["TEST_CREDS"])
@@ -20,7 +20,7 @@ except ImportError:
 class TestAwsProvidersSetup(BaseCase, TestCase):
     def setUp(self) -> None:
         super().setUp()
-        with open(self.shared_datadir / "test_aws_cli_responses.json") as f:
+        with open(self.data_dir / "test_aws_cli_responses.json") as f:
             self.data = json.load(f)
         self.settings = Settings(**self.default_settings)
 
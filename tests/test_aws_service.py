@@ -18,7 +18,7 @@ except ImportError:
 class TestAwsSetupService(BaseCase, TestCase):
     def setUp(self) -> None:
         super().setUp()
-        with open(self.shared_datadir / "test_aws_service_responses.json") as f:
+        with open(self.data_dir / "test_aws_service_responses.json") as f:
             self.data = json.load(f)
         self.settings = Settings(**self.default_settings)
 
@@ -17,7 +17,7 @@ class TestAwsSettings(BaseCase, TestCase):
         super().setUp()
         self.settings = Settings(
             **self.default_settings,
-            secrets_dir=str(self.shared_datadir),
+            secrets_dir=str(self.data_dir),
         )
 
     def aws_settings(self, overrides: dict) -> AwsSpecificSettings:
@@ -57,7 +57,7 @@ class TestAwsSettings(BaseCase, TestCase):
         Returns:
             list[AwsSpecificSettings]: List of AWS provider settings.
         """
-        self.settings.providers_config_file = self.shared_datadir / "aws" / file_name
+        self.settings.providers_config_file = self.data_dir / "aws" / file_name
         self.settings.read_providers_config_file([ProviderEnum.AWS])
         provider_settings = self.settings.providers[ProviderEnum.AWS]
         settings: list[AwsSpecificSettings] = list(provider_settings.values())  # type: ignore
@@ -27,7 +27,7 @@ class TestAzureCloudConnector(BaseConnectorCase, TestCase):
 
     def setUp(self) -> None:
         super().setUp()
-        with open(self.shared_datadir / "test_azure_responses.json") as f:
+        with open(self.data_dir / "test_azure_responses.json") as f:
             self.data = json.load(f)
         test_azure_settings = AzureSpecificSettings.from_dict(self.data["TEST_CREDS"])
         self.settings.providers[ProviderEnum.AZURE] = {
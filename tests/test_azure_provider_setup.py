@@ -24,7 +24,7 @@ except ImportError:
 class TestAzureProviderSetup(BaseCase, TestCase):
     def setUp(self) -> None:
         super().setUp()
-        with open(self.shared_datadir / "test_azure_responses.json") as f:
+        with open(self.data_dir / "test_azure_responses.json") as f:
             self.data = json.load(f)
         self.settings = Settings(**self.default_settings)
         self.setup_cli = __provider_setup__(self.settings)
@@ -1,69 +1,90 @@
+from types import ModuleType
 from typing import Optional
-from unittest import TestCase
+from unittest.mock import MagicMock
 
 import pytest
-from parameterized import parameterized
+from pytest_mock import MockerFixture
 
 from censys.cloud_connectors.common.cli.base import BaseCli
 
 from .base_case import BaseCase
 
 TEST_MESSAGE = "test message"
+PRINT_TYPE_CASES = [
+    (BaseCli.print_info, "[info]i[/info] " + TEST_MESSAGE),
+    (BaseCli.print_warning, "[yellow]![/yellow] " + TEST_MESSAGE),
+    (BaseCli.print_error, "[red]✘[/red] " + TEST_MESSAGE),
+    (BaseCli.print_success, "[green]✔[/green] " + TEST_MESSAGE),
+    (BaseCli.print_question, "[questionmark]?[/questionmark] " + TEST_MESSAGE),
+]
+
+
+class TestBaseCli(BaseCase):
+    base_cli: BaseCli
+    cli_base_module: ModuleType
+    mock_inquirer: MagicMock
+
+    @pytest.fixture(autouse=True, scope="class")
+    def __patch_inquirer(
+        self,
+        request: pytest.FixtureRequest,
+        class_mocker: MockerFixture,
+        cli_base_module: ModuleType,
+    ):
+        """Patches inquirer_prompt once for the whole class."""
+        request.cls.mock_inquirer = class_mocker.patch.object(
+            cli_base_module, "inquirer_prompt"
+        )
 
+    @pytest.fixture(autouse=True)
+    def __reset_inquirer(self):
+        """Resets the class-wide inquirer_prompt mock before each test.
 
-class TestBaseCli(BaseCase, TestCase):
-    def setUp(self):
-        super().setUp()
-        self.base_cli = BaseCli()
+        The patch is shared by the whole class, so calls, return values and
+        side effects set by one test must not leak into the next.
+        """
+        self.mock_inquirer.reset_mock(return_value=True, side_effect=True)
 
-    @parameterized.expand(
-        [
-            ("[info]i[/info] ", "print_info"),
-            ("[yellow]![/yellow] ", "print_warning"),
-            ("[red]✘[/red] ", "print_error"),
-            ("[green]✔[/green] ", "print_success"),
-            ("[questionmark]?[/questionmark] ", "print_question"),
-        ]
-    )
-    def test_print_types(self, prefix: str, method: str):
+    @pytest.fixture(autouse=True)
+    def __inject_cli(self, base_cli: BaseCli, cli_base_module: ModuleType):
+        """Injects the session-wide BaseCli and cli base module."""
+        self.base_cli = base_cli
+        self.cli_base_module = cli_base_module
+
+    def test_print_types(self):
         # Mock
-        mock_print = self.mocker.patch("censys.cloud_connectors.common.cli.base.print")
+        mock_print = self.mocker.patch.object(self.cli_base_module, "print")
 
-        # Actual call
-        print_func = getattr(self.base_cli, method)
-        print_func(TEST_MESSAGE)
+        for print_func, expected_output in PRINT_TYPE_CASES:
+            # Actual call
+            print_func(TEST_MESSAGE)
 
-        # Assertions
-        mock_print.assert_called_once_with(prefix + TEST_MESSAGE)
+            # Assertions
+            mock_print.assert_called_once_with(expected_output)
+            mock_print.reset_mock()
 
     def test_print_command(self):
         # Mock
-        mock_print = self.mocker.patch("censys.cloud_connectors.common.cli.base.print")
-        mock_syntax = self.mocker.patch(
-            "censys.cloud_connectors.common.cli.base.Syntax"
-        )
+        mock_print = self.mocker.patch.object(self.cli_base_module, "print")
+        mock_syntax = self.mocker.patch.object(self.cli_base_module, "Syntax")
 
         # Actual call
         self.base_cli.print_command("test command")
 
         # Assertions
         mock_syntax.assert_called_once_with("test command", "bash", word_wrap=True)
-        # mock_print.assert_called_once_with(mock_syntax.return_value)
-        calls = [
+        assert mock_print.call_args_list == [
             self.mocker.call(),
             self.mocker.call(mock_syntax.return_value),
             self.mocker.call(),
         ]
-        mock_print.assert_has_calls(calls)
 
     def test_print_json(self):
         # Test data
         test_json_object = {"test": "json"}
 
         # Mock
-        mock_print = self.mocker.patch(
-            "censys.cloud_connectors.common.cli.base.rich.print_json"
-        )
+        mock_print = self.mocker.patch.object(self.cli_base_module.rich, "print_json")
 
         # Actual call
         self.base_cli.print_json(test_json_object)
@@ -76,10 +97,7 @@ class TestBaseCli(BaseCase, TestCase):
         test_answers = {"test": "answers"}
 
         # Mock
-        self.mocker.patch(
-            "censys.cloud_connectors.common.cli.base.inquirer_prompt",
-            return_value=test_answers,
-        )
+        self.mock_inquirer.return_value = test_answers
 
         # Actual call
         actual_answers = self.base_cli.prompt([{"type": "input", "name": "test"}])
@@ -87,21 +105,22 @@ class TestBaseCli(BaseCase, TestCase):
         # Assertions
         assert actual_answers == test_answers
 
-    @parameterized.expand(
+    @pytest.mark.parametrize(
+        ("type", "expected_instruction", "given_instructions", "multiselect"),
         [
-            ("input"),
-            ("input", "draw", "draw"),
-            ("list", "(Use arrow keys)"),
+            ("input", None, None, None),
+            ("input", "draw", "draw", None),
+            ("list", "(Use arrow keys)", None, None),
             ("list", "(Use ctrl+r to select all)", None, True),
-            ("filepath", "(Tab completion is enabled)"),
-        ]
+            ("filepath", "(Tab completion is enabled)", None, None),
+        ],
     )
     def test_prompt_instructions(
         self,
         type: str,
-        expected_instruction: Optional[str] = None,
-        given_instructions: Optional[str] = None,
-        multiselect: Optional[bool] = None,
+        expected_instruction: Optional[str],
+        given_instructions: Optional[str],
+        multiselect: Optional[bool],
     ):
         # Test data
         given_question = {
@@ -118,15 +137,11 @@ class TestBaseCli(BaseCase, TestCase):
             "multiselect": multiselect,
         }
 
-        # Mock
-        mock_prompt = self.mocker.patch(
-            "censys.cloud_connectors.common.cli.base.inquirer_prompt"
-        )
         # Actual call
         self.base_cli.prompt(given_question)
 
         # Assertions
-        mock_prompt.assert_called_once_with([expected_question])
+        self.mock_inquirer.assert_called_once_with([expected_question])
 
     def test_prompt_multiple(self):
         # Test data
@@ -139,31 +154,26 @@ class TestBaseCli(BaseCase, TestCase):
             {"type": "list", "name": "test_list", "instruction": "(Use arrow keys)"},
         ]
 
-        # Mock
-        mock_prompt = self.mocker.patch(
-            "censys.cloud_connectors.common.cli.base.inquirer_prompt"
-        )
         # Actual call
         self.base_cli.prompt(given_questions)
 
         # Assertions
-        mock_prompt.assert_called_once_with(expected_questions)
+        self.mock_inquirer.assert_called_once_with(expected_questions)
 
     def test_prompt_no_answers(self):
         # Mock
-        self.mocker.patch(
-            "censys.cloud_connectors.common.cli.base.inquirer_prompt", return_value={}
-        )
+        self.mock_inquirer.return_value = {}
 
         # Actual call
         with pytest.raises(KeyboardInterrupt):
             self.base_cli.prompt([{"type": "input", "name": "test"}])
 
-    @parameterized.expand(
+    @pytest.mark.parametrize(
+        ("choose", "expected_answer"),
         [
             (True, {"name": "test_name", "value": "test_value"}),
             (False, None),
-        ]
+        ],
     )
     def test_prompt_select_one_from_one(
         self, choose: bool, expected_answer: Optional[dict]
@@ -172,8 +182,9 @@ class TestBaseCli(BaseCase, TestCase):
         test_choices = [{"name": "test_name", "value": "test_value"}]
 
         # Mock
-        self.mocker.patch(
-            "censys.cloud_connectors.common.cli.base.prompt",
+        self.mocker.patch.object(
+            self.cli_base_module,
+            "prompt",
             return_value={"use_only_choice": choose},
         )
 
@@ -193,8 +204,9 @@ class TestBaseCli(BaseCase, TestCase):
         ]
 
         # Mock
-        self.mocker.patch(
-            "censys.cloud_connectors.common.cli.base.prompt",
+        self.mocker.patch.object(
+            self.cli_base_module,
+            "prompt",
             return_value={"choice": test_answers},
         )
 
@@ -206,23 +218,23 @@ class TestBaseCli(BaseCase, TestCase):
         # Assertions
         assert actual_answers == test_answers
 
-    @parameterized.expand(
-        [
+    def test_run_command(self):
+        # Test data
+        test_command = "test command"
+        test_cases = [
             ({}, {"shell": True, "capture_output": True, "text": True}),
             ({"shell": False}, {"shell": False}),
         ]
-    )
-    def test_run_command(self, test_kwargs, expected_kwargs):
-        # Test data
-        test_command = "test command"
 
         # Mock
-        mock_run = self.mocker.patch(
-            "censys.cloud_connectors.common.cli.base.subprocess.run", return_value=0
+        mock_run = self.mocker.patch.object(
+            self.cli_base_module.subprocess, "run", return_value=0
         )
 
-        # Actual call
-        self.base_cli.run_command(test_command, **test_kwargs)
+        for test_kwargs, expected_kwargs in test_cases:
+            # Actual call
+            self.base_cli.run_command(test_command, **test_kwargs)
 
-        # Assertions
-        mock_run.assert_called_once_with(test_command, **expected_kwargs)
+            # Assertions
+            mock_run.assert_called_once_with(test_command, **expected_kwargs)
+            mock_run.reset_mock()
@@ -1,7 +1,8 @@
-from unittest import TestCase
+import sys
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
 
 import pytest
-from parameterized import parameterized
 
 from censys.cloud_connectors.common.cli import main
 from censys.cloud_connectors.common.cli.commands import config, scan
@@ -9,21 +10,26 @@ from censys.cloud_connectors.common.enums import ProviderEnum
 from tests.base_case import BaseCase
 
 
-class TestCli(BaseCase, TestCase):
+class TestCli(BaseCase):
     @pytest.fixture(autouse=True)
     def __inject_fixtures(self, capsys):
-        super().setUp()
         self.capsys = capsys
 
-    @parameterized.expand(
+    @pytest.mark.parametrize(
+        ("commands", "expected_output"),
         [
             ([], "usage: censys-cc"),
             (["--version"], "Censys Cloud Connectors Version:"),
-        ]
+        ],
     )
-    def test_main(self, commands: list, expected_output: str):
+    def test_main(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        commands: list,
+        expected_output: str,
+    ):
         # Mock sys.argv
-        self.mocker.patch("sys.argv", ["censys-cc"] + commands)
+        monkeypatch.setattr(sys, "argv", ["censys-cc", *commands])
 
         # Actual call
         with pytest.raises(SystemExit):
@@ -34,33 +40,50 @@ class TestCli(BaseCase, TestCase):
         assert expected_output in captured.out
 
 
-class TestConfigCli(BaseCase, TestCase):
+@pytest.fixture(scope="module")
+def patched_config_module():
+    """Patches the config command's collaborators once for the whole module."""
+    patcher = patch.multiple(
+        "censys.cloud_connectors.common.cli.commands.config",
+        importlib=DEFAULT,
+        prompt=DEFAULT,
+        Settings=DEFAULT,
+    )
+    mocks = patcher.start()
+    yield SimpleNamespace(
+        importlib=mocks["importlib"].import_module,
+        settings=mocks["Settings"],
+        prompt=mocks["prompt"],
+    )
+    patcher.stop()
+
+
+class TestConfigCli(BaseCase):
+    config_mocks: SimpleNamespace
+
+    @pytest.fixture(autouse=True)
+    def __config_mocks(self, patched_config_module: SimpleNamespace):
+        """Resets the shared config command mocks before each test."""
+        for mock in vars(patched_config_module).values():
+            mock.reset_mock(return_value=True, side_effect=True)
+        patched_config_module.importlib.return_value.__provider_setup__ = Mock()
+        self.config_mocks = patched_config_module
+
     def test_cli_config(self):
         # Mock
-        mock_prompt = self.mocker.patch(
-            "censys.cloud_connectors.common.cli.commands.config.prompt",
-            return_value={"provider": ProviderEnum.AZURE},
-        )
+        self.config_mocks.prompt.return_value = {"provider": ProviderEnum.AZURE}
 
-        mock_args = self.mocker.MagicMock()
-        mock_args.provider = None
+        mock_args = SimpleNamespace(provider=None)
 
-        mock_importlib = self.mocker.patch(
-            "censys.cloud_connectors.common.cli.commands.config.importlib.import_module"
-        )
-        mock_setup_cls = (
-            mock_importlib.return_value.__provider_setup__
-        ) = self.mocker.Mock()
-        mock_settings = self.mocker.patch(
-            "censys.cloud_connectors.common.cli.commands.config.Settings"
-        )
-        mock_settings.return_value.read_providers_config_file = self.mocker.Mock()
+        mock_importlib = self.config_mocks.importlib
+        mock_setup_cls = mock_importlib.return_value.__provider_setup__
+        mock_settings = self.config_mocks.settings
 
         # Actual call
         config.cli_config(mock_args)
 
         # Assertions
-        assert mock_prompt.call_count == 1
+        assert self.config_mocks.prompt.call_count == 1
         mock_importlib.assert_called_once_with(
             "censys.cloud_connectors.azure_connector"
         )
@@ -70,36 +93,27 @@ class TestConfigCli(BaseCase, TestCase):
 
     def test_cli_config_provider_option(self):
         # Mock
-        mock_args = self.mocker.MagicMock()
-        mock_args.provider = ProviderEnum.GCP
+        mock_args = SimpleNamespace(provider=ProviderEnum.GCP)
 
-        mock_importlib = self.mocker.patch(
-            "censys.cloud_connectors.common.cli.commands.config.importlib.import_module"
-        )
-        mock_setup_cls = (
-            mock_importlib.return_value.__provider_setup__
-        ) = self.mocker.Mock()
-        mock_settings = self.mocker.patch(
-            "censys.cloud_connectors.common.cli.commands.config.Settings"
-        )
-        mock_settings.return_value.read_providers_config_file = self.mocker.Mock()
+        mock_importlib = self.config_mocks.importlib
+        mock_setup_cls = mock_importlib.return_value.__provider_setup__
+        mock_settings = self.config_mocks.settings
 
         # Actual call
         config.cli_config(mock_args)
 
         # Assertions
+        self.config_mocks.prompt.assert_not_called()
         mock_importlib.assert_called_once_with("censys.cloud_connectors.gcp_connector")
         mock_settings.return_value.read_providers_config_file.assert_called_once_with()
         mock_setup_cls.assert_called_once()
         mock_setup_cls.return_value.setup.assert_called_once()
 
 
-class TestScanCli(BaseCase, TestCase):
+class TestScanCli(BaseCase):
     def test_cli_scan(self):
         # Mock
-        mock_args = self.mocker.MagicMock()
-        mock_args.provider = None
-        mock_args.scan_interval = None
+        mock_args = SimpleNamespace(provider=None, scan_interval=None)
 
         mock_settings = self.mocker.patch(
             "censys.cloud_connectors.common.cli.commands.scan.Settings"
@@ -118,9 +132,7 @@ class TestScanCli(BaseCase, TestCase):
 
     def test_cli_scan_provider_option(self):
         # Mock
-        mock_args = self.mocker.MagicMock()
-        mock_args.provider = [ProviderEnum.AZURE]
-        mock_args.scan_interval = None
+        mock_args = SimpleNamespace(provider=[ProviderEnum.AZURE], scan_interval=None)
 
         mock_settings = self.mocker.patch(
             "censys.cloud_connectors.common.cli.commands.scan.Settings"
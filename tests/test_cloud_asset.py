@@ -1,7 +1,4 @@
-from unittest import TestCase
-
 import pytest
-from parameterized import parameterized
 
 from censys.cloud_connectors.common.cloud_asset import (
     AzureContainerAsset,
@@ -16,9 +13,20 @@ TEST_TYPE = "test_type"
 TEST_VALUE = "test_value"
 TEST_SCAN_DATA = {"test_scan_data": "test_scan_data"}
 TEST_UID = "test_uid"
+TEST_BUCKET_NAME = "test-bucket"
+TEST_BUCKET_URL = f"https://storage.googleapis.com/{TEST_BUCKET_NAME}"
+TEST_CONTAINER_NAME = "test-container"
+TEST_CONTAINER_URL = f"https://{TEST_CONTAINER_NAME}.blob.core.windows.net"
+GCP_LABEL = ProviderEnum.GCP.label()
+EXPECTED_GCP_ASSET_DICT = {
+    "type": TEST_TYPE,
+    "value": TEST_VALUE,
+    "cspLabel": GCP_LABEL,
+    "scanData": '{"test_scan_data": "test_scan_data"}',
+}
 
 
-class CloudAssetTest(BaseCase, TestCase):
+class TestCloudAsset(BaseCase):
     def test_cloud_asset_to_dict(self):
         cloud_asset = CloudAsset(
             type=TEST_TYPE,
@@ -28,59 +36,48 @@ class CloudAssetTest(BaseCase, TestCase):
             uid=TEST_UID,
         )
         assert cloud_asset.uid == TEST_UID
-        assert cloud_asset.to_dict() == {
-            "type": TEST_TYPE,
-            "value": TEST_VALUE,
-            "cspLabel": ProviderEnum.GCP.label(),
-            "scanData": '{"test_scan_data": "test_scan_data"}',
-        }
+        assert cloud_asset.to_dict() == EXPECTED_GCP_ASSET_DICT
 
-    def test_object_storage_asset(self):
-        cloud_asset = ObjectStorageAsset(
-            value=TEST_VALUE, csp_label=ProviderEnum.GCP, uid=TEST_UID
-        )
-        assert cloud_asset.type == "OBJECT_STORAGE"
-
-    def test_gcp_cloud_storage_asset(self):
-        test_object_name = "test-bucket"
-        test_value = f"https://storage.googleapis.com/{test_object_name}"
-        cloud_asset = GcpStorageBucketAsset(value=test_value, uid=test_object_name)
-        assert cloud_asset.type == "OBJECT_STORAGE"
-        assert cloud_asset.value == test_value
-        assert cloud_asset.csp_label == ProviderEnum.GCP
-        assert cloud_asset.scan_data == {}
-        assert cloud_asset.uid == "test-bucket"
-
-    @parameterized.expand(
+    @pytest.mark.parametrize(
+        ("asset_cls", "asset_kwargs", "expected_csp_label"),
         [
             (
-                "http://not.valid.bucket/url",
-                "Bucket name must start with https://storage.googleapis.com/",
+                ObjectStorageAsset,
+                {"value": TEST_VALUE, "csp_label": ProviderEnum.GCP, "uid": TEST_UID},
+                ProviderEnum.GCP,
+            ),
+            (
+                GcpStorageBucketAsset,
+                {"value": TEST_BUCKET_URL, "uid": TEST_BUCKET_NAME},
+                ProviderEnum.GCP,
             ),
-        ]
+            (
+                AzureContainerAsset,
+                {"value": TEST_CONTAINER_URL, "uid": TEST_CONTAINER_NAME},
+                ProviderEnum.AZURE,
+            ),
+        ],
     )
-    def test_gcp_cloud_storage_asset_validation(self, value, expected_error):
-        with pytest.raises(ValueError, match=expected_error):
-            GcpStorageBucketAsset(value=value, uid=TEST_UID)
-
-    def test_azure_container_asset(self):
-        test_object_name = "test-container"
-        test_value = f"https://{test_object_name}.blob.core.windows.net"
-        cloud_asset = AzureContainerAsset(value=test_value, uid=test_object_name)
+    def test_object_storage_asset(
+        self,
+        asset_cls: type[ObjectStorageAsset],
+        asset_kwargs: dict,
+        expected_csp_label: ProviderEnum,
+    ):
+        cloud_asset = asset_cls(**asset_kwargs)
         assert cloud_asset.type == "OBJECT_STORAGE"
-        assert cloud_asset.value == test_value
-        assert cloud_asset.csp_label == ProviderEnum.AZURE
+        assert cloud_asset.value == asset_kwargs["value"]
+        assert cloud_asset.csp_label == expected_csp_label
         assert cloud_asset.scan_data == {}
-        assert cloud_asset.uid == "test-container"
+        assert cloud_asset.uid == asset_kwargs["uid"]
 
-    @parameterized.expand(
-        [
-            (
-                "not.valid.bucket/url",
-                "Container URL is not valid",
-            ),
-        ]
-    )
-    def test_azure_container_asset_validation(self, value, expected_error):
-        with pytest.raises(ValueError, match=expected_error):
-            AzureContainerAsset(value=value, uid=TEST_UID)
+    def test_gcp_cloud_storage_asset_validation(self):
+        with pytest.raises(
+            ValueError,
+            match="Bucket name must start with https://storage.googleapis.com/",
+        ):
+            GcpStorageBucketAsset(value="http://not.valid.bucket/url", uid=TEST_UID)
+
+    def test_azure_container_asset_validation(self):
+        with pytest.raises(ValueError, match="Container URL is not valid"):
+            AzureContainerAsset(value="not.valid.bucket/url", uid=TEST_UID)
@@ -1,4 +1,6 @@
-from unittest import TestCase
+from pathlib import Path
+from typing import Optional
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -25,12 +27,70 @@ class ExampleCloudConnector(CloudConnector):
         return super().scan_all()
 
 
-class TestCloudConnector(BaseConnectorCase, TestCase):
+@pytest.fixture(scope="module")
+def base_settings(data_dir: Path, default_settings: dict) -> Settings:
+    return Settings(
+        **default_settings,
+        providers_config_file=str(data_dir / "test_empty_providers.yml"),
+    )
+
+
+@pytest.fixture
+def connector(base_settings: Settings) -> ExampleCloudConnector:
+    return ExampleCloudConnector(base_settings)
+
+
+@pytest.fixture
+def seed() -> Seed:
+    return Seed(type="TEST", value="test-value", label="test-label")
+
+
+@pytest.fixture
+def cloud_asset() -> CloudAsset:
+    return CloudAsset(
+        type="TEST",
+        value="test-value",
+        csp_label=ExampleCloudConnector.provider,
+        uid="test-uid",
+    )
+
+
+@pytest.fixture
+def seed_label(connector: ExampleCloudConnector) -> str:
+    return connector.label_prefix + "test-label"
+
+
+@pytest.fixture
+def asset_uid(connector: ExampleCloudConnector) -> str:
+    return connector.label_prefix + "test-uid"
+
+
+@pytest.fixture
+def mock_replace_seeds(connector: ExampleCloudConnector, mocker) -> MagicMock:
+    return mocker.patch.object(connector.seeds_api, "replace_seeds_by_label")
+
+
+@pytest.fixture
+def mock_add_cloud_assets(connector: ExampleCloudConnector, mocker) -> MagicMock:
+    return mocker.patch.object(connector.beta_api, "add_cloud_assets")
+
+
+@pytest.fixture
+def mock_logger_error(connector: ExampleCloudConnector, mocker) -> MagicMock:
+    return mocker.patch.object(connector.logger, "error")
+
+
+class TestCloudConnector(BaseConnectorCase):
     connector: ExampleCloudConnector
+    connector_cls = ExampleCloudConnector
 
-    def setUp(self) -> None:
-        super().setUp()
-        self.setUpConnector(ExampleCloudConnector)
+    @pytest.fixture(autouse=True)
+    def __setup_connector(
+        self, base_settings: Settings, connector: ExampleCloudConnector
+    ):
+        """Binds the shared settings and a fresh connector to the test case."""
+        self.settings = base_settings
+        self.connector = connector
 
     def test_init_fail(self):
         # Mock provider
@@ -56,84 +116,69 @@ class TestCloudConnector(BaseConnectorCase, TestCase):
         with pytest.raises(CensysException, match="No ASM API key configured."):
             ExampleCloudConnector(test_settings)
 
-    def test_add_seed(self):
-        seed = Seed(type="TEST", value="test-value", label="test-label")
-        self.connector.add_seed(seed)
-        test_label = self.connector.label_prefix + "test-label"
-        assert len(self.connector.seeds[test_label]) == 1
-        assert self.connector.seeds[test_label].pop() == seed
-
-    def test_add_cloud_asset(self):
-        asset = CloudAsset(
-            type="TEST", value="test-value", csp_label=ProviderEnum.GCP, uid="test-uid"
-        )
-        self.connector.add_cloud_asset(asset)
-        test_uid = self.connector.label_prefix + "test-uid"
-        assert len(self.connector.cloud_assets[test_uid]) == 1
-        assert self.connector.cloud_assets[test_uid].pop() == asset
-
-    def test_submit_seeds(self):
-        seed = Seed(type="TEST", value="test-value", label="test-label")
-        self.connector.add_seed(seed)
-        replace_seeds_mock = self.mocker.patch.object(
-            self.connector.seeds_api, "replace_seeds_by_label"
-        )
-        self.connector.submit_seeds()
-        replace_seeds_mock.assert_called_once_with(
-            self.connector.label_prefix + "test-label",
-            [seed.to_dict()],
-        )
-
-    def test_fail_submit_seeds(self):
-        seed = Seed(type="TEST", value="test-value", label="test-label")
+    def test_add_seed(self, seed: Seed, seed_label: str):
         self.connector.add_seed(seed)
-        replace_seeds_mock = self.mocker.patch.object(
-            self.connector.seeds_api, "replace_seeds_by_label"
-        )
-        replace_seeds_mock.side_effect = CensysAsmException(404, "Test Exception")
-        logger_mock = self.mocker.patch.object(self.connector.logger, "error")
-        self.connector.submit_seeds()
-        logger_mock.assert_called_once()
-
-    def test_submit_cloud_assets(self):
+        assert len(self.connector.seeds[seed_label]) == 1
+        assert self.connector.seeds[seed_label].pop() == seed
+
+    def test_add_cloud_asset(self, cloud_asset: CloudAsset, asset_uid: str):
+        self.connector.add_cloud_asset(cloud_asset)
+        assert len(self.connector.cloud_assets[asset_uid]) == 1
+        assert self.connector.cloud_assets[asset_uid].pop() == cloud_asset
+
+    @pytest.mark.parametrize(
+        "side_effect",
+        [None, CensysAsmException(404, "Test Exception")],
+        ids=["ok", "fail"],
+    )
+    def test_submit_seeds(
+        self,
+        seed: Seed,
+        seed_label: str,
+        side_effect: Optional[Exception],
+        mock_replace_seeds: MagicMock,
+        mock_logger_error: MagicMock,
+    ):
         # Test data
-        asset = CloudAsset(
-            type="TEST", value="test-value", csp_label=ProviderEnum.GCP, uid="test-uid"
-        )
-        self.connector.add_cloud_asset(asset)
+        self.connector.add_seed(seed)
 
         # Mock
-        add_cloud_mock = self.mocker.patch.object(
-            self.connector.beta_api, "add_cloud_assets"
-        )
+        mock_replace_seeds.side_effect = side_effect
 
         # Actual call
-        self.connector.submit_cloud_assets()
+        self.connector.submit_seeds()
 
         # Assertions
-        add_cloud_mock.assert_called_once_with(
-            self.connector.label_prefix + "test-uid", [asset.to_dict()]
-        )
-
-    def test_fail_submit_cloud_assets(self):
+        mock_replace_seeds.assert_called_once_with(seed_label, [seed.to_dict()])
+        assert mock_logger_error.call_count == (1 if side_effect else 0)
+
+    @pytest.mark.parametrize(
+        "side_effect",
+        [None, CensysAsmException(404, "Test Exception")],
+        ids=["ok", "fail"],
+    )
+    def test_submit_cloud_assets(
+        self,
+        cloud_asset: CloudAsset,
+        asset_uid: str,
+        side_effect: Optional[Exception],
+        mock_add_cloud_assets: MagicMock,
+        mock_logger_error: MagicMock,
+    ):
         # Test data
-        asset = CloudAsset(
-            type="TEST", value="test-value", csp_label=ProviderEnum.GCP, uid="test-uid"
-        )
-        self.connector.add_cloud_asset(asset)
+        self.connector.add_cloud_asset(cloud_asset)
 
         # Mock
-        add_cloud_mock = self.mocker.patch.object(
-            self.connector.beta_api, "add_cloud_assets"
-        )
-        add_cloud_mock.side_effect = CensysAsmException(404, "Test Exception")
-        logger_mock = self.mocker.patch.object(self.connector.logger, "error")
+        mock_add_cloud_assets.side_effect = side_effect
 
         # Actual call
         self.connector.submit_cloud_assets()
 
         # Assertions
-        logger_mock.assert_called_once()
+        mock_add_cloud_assets.assert_called_once_with(
+            asset_uid, [cloud_asset.to_dict()]
+        )
+        assert mock_logger_error.call_count == (1 if side_effect else 0)
 
     def test_submit(self):
         # Mock
@@ -1,12 +1,17 @@
-import json
-from unittest import TestCase
-from unittest.mock import MagicMock
+import copy
+from collections.abc import Iterable
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock, Mock
 
 import pytest
-from parameterized import parameterized
+from pytest_mock import MockerFixture
 
+from censys.cloud_connectors.common.connector import CloudConnector
 from censys.cloud_connectors.common.enums import ProviderEnum
 from censys.cloud_connectors.common.settings import Settings
+from censys.cloud_connectors.gcp_connector import connector as gcp_connector_module
 from censys.cloud_connectors.gcp_connector.connector import GcpCloudConnector
 from censys.cloud_connectors.gcp_connector.enums import GcpCloudAssetInventoryTypes
 from censys.cloud_connectors.gcp_connector.settings import GcpSpecificSettings
@@ -21,148 +26,308 @@ try:
         ResourceSearchResult,
         SearchAllResourcesResponse,
     )
+    from google.oauth2 import service_account
+    from google.protobuf import json_format
 except ImportError:
     failed_import = True
 
 
+# Label (and cloud asset uid) of assets in the test project
+TEST_LABEL = "GCP: 111222333444/censys-cc-test-project"
+
+# Projects of the test assets (the connector only reads all_projects)
+TEST_ALL_PROJECTS = {
+    "123456789123": {
+        "project_id": "censys-cc-test-project",
+        "name": "Censys CC Test Project",
+    }
+}
+
+SEED_ASSET_CASES = [
+    pytest.param(
+        "get_compute_instances",
+        GcpCloudAssetInventoryTypes.COMPUTE_INSTANCE,
+        "TEST_COMPUTE_INSTANCE",
+        "networkInterfaces.0.accessConfigs.0.natIP",
+        ("35.0.0.0", "35.0.0.1", "35.0.0.2"),
+        id="compute_instances",
+    ),
+    pytest.param(
+        "get_compute_addresses",
+        GcpCloudAssetInventoryTypes.COMPUTE_ADDRESS,
+        "TEST_COMPUTE_ADDRESS",
+        "address",
+        ("35.0.0.0", "35.0.0.1", "35.0.0.2"),
+        id="compute_addresses",
+    ),
+    pytest.param(
+        "get_container_clusters",
+        GcpCloudAssetInventoryTypes.CONTAINER_CLUSTER,
+        "TEST_CONTAINER_CLUSTER",
+        "privateClusterConfig.publicEndpoint",
+        ("104.0.0.0", "104.0.0.1", "104.0.0.2"),
+        id="container_clusters",
+    ),
+    pytest.param(
+        "get_dns_records",
+        GcpCloudAssetInventoryTypes.DNS_ZONE,
+        "TEST_DNS_ZONE",
+        "dnsName",
+        ("0.censys.io.", "1.censys.io.", "2.censys.io."),
+        id="dns_records",
+    ),
+]
+
+# Credentials keys and the resource types their settings ignore
+IGNORE_CASES = [
+    pytest.param("TEST_CREDS", set(), id="default"),
+    pytest.param(
+        "TEST_CREDS_IGNORE",
+        {
+            GcpCloudAssetInventoryTypes.STORAGE_BUCKET,
+            GcpCloudAssetInventoryTypes.COMPUTE_ADDRESS,
+            GcpCloudAssetInventoryTypes.CONTAINER_CLUSTER,
+        },
+        id="ignore",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def gcp_settings(gcp_responses: dict) -> GcpSpecificSettings:
+    return GcpSpecificSettings.from_dict(dict(gcp_responses["TEST_CREDS"]))
+
+
+@pytest.fixture(scope="module")
+def gcp_provider_settings(
+    request: pytest.FixtureRequest, gcp_responses: dict
+) -> GcpSpecificSettings:
+    """Settings built from the credentials key passed in with indirect=True."""
+    return GcpSpecificSettings.from_dict(dict(gcp_responses[request.param]))
+
+
+def set_resource_field(asset: dict, field_path: str, value: Any) -> None:
+    """Set a field on the asset's versioned resource.
+
+    Args:
+        asset (dict): The asset data.
+        field_path (str): Dotted path from the resource (digits index lists).
+        value (Any): The value to set.
+    """
+    *parents, leaf = (
+        int(part) if part.isdigit() else part for part in field_path.split(".")
+    )
+    target = asset["versioned_resources"][0]["resource"]
+    for part in parents:
+        target = target[part]
+    target[leaf] = value
+
+
+def parse_asset(data: dict) -> "ResourceSearchResult":
+    """Parse asset data straight into a ResourceSearchResult (no JSON round-trip).
+
+    Args:
+        data (dict): The asset data.
+
+    Returns:
+        ResourceSearchResult: The test ResourceSearchResult object.
+    """
+    return ResourceSearchResult.wrap(
+        json_format.ParseDict(data, ResourceSearchResult.pb()())
+    )
+
+
+def build_asset(template: dict, field_path: str, value: Any) -> "ResourceSearchResult":
+    """Build a ResourceSearchResult from a copy of the template with one field set.
+
+    Args:
+        template (dict): The asset data to copy (left unmodified).
+        field_path (str): Dotted path from the resource (digits index lists).
+        value (Any): The value to set.
+
+    Returns:
+        ResourceSearchResult: The test ResourceSearchResult object.
+    """
+    asset = copy.deepcopy(template)
+    set_resource_field(asset, field_path, value)
+    return parse_asset(asset)
+
+
+@pytest.fixture(scope="module")
+def gcp_base_settings(
+    data_dir: Path, default_settings: dict, gcp_settings: GcpSpecificSettings
+) -> Settings:
+    settings = Settings(**default_settings, secrets_dir=str(data_dir))
+    settings.providers[ProviderEnum.GCP] = {
+        gcp_settings.get_provider_key(): gcp_settings
+    }
+    return settings
+
+
+@pytest.fixture
+def gcp_connector(gcp_base_settings: Settings) -> GcpCloudConnector:
+    return GcpCloudConnector(gcp_base_settings)
+
+
+@pytest.fixture
+def gcp_credentials() -> MagicMock:
+    return MagicMock(spec=service_account.Credentials)
+
+
+@pytest.fixture
+def mock_cai_client(mocker: MockerFixture) -> MagicMock:
+    """Patch the Cloud Asset Inventory client class used by the connector."""
+    return mocker.patch.object(gcp_connector_module, "AssetServiceClient")
+
+
+@pytest.fixture
+def gcp_patches(mocker: MockerFixture) -> SimpleNamespace:
+    """Patch the credentials loader, the Healthcheck and CloudConnector.scan."""
+    return SimpleNamespace(
+        base_scan=mocker.patch.object(CloudConnector, "scan"),
+        credentials=mocker.patch.object(
+            gcp_connector_module.service_account.Credentials,
+            "from_service_account_file",
+        ),
+        healthcheck=mocker.patch.object(gcp_connector_module, "Healthcheck"),
+    )
+
+
+@pytest.fixture
+def seed_scanners(
+    monkeypatch: pytest.MonkeyPatch, gcp_connector: GcpCloudConnector
+) -> dict[str, Mock]:
+    """Replace each of the connector's seed scanners with a Mock."""
+    scanners = {seed_type: Mock() for seed_type in gcp_connector.seed_scanners}
+    monkeypatch.setattr(gcp_connector, "seed_scanners", scanners)
+    return scanners
+
+
+@pytest.fixture
+def cloud_asset_scanners(
+    monkeypatch: pytest.MonkeyPatch, gcp_connector: GcpCloudConnector
+) -> dict[str, Mock]:
+    """Replace each of the connector's cloud asset scanners with a Mock."""
+    scanners = {asset_type: Mock() for asset_type in gcp_connector.cloud_asset_scanners}
+    monkeypatch.setattr(gcp_connector, "cloud_asset_scanners", scanners)
+    return scanners
+
+
 @pytest.mark.skipif(failed_import, reason="Failed to import gcp dependencies")
-class TestGcpConnector(BaseConnectorCase, TestCase):
+class TestGcpConnector(BaseConnectorCase):
     connector: GcpCloudConnector
     connector_cls = GcpCloudConnector
-
-    def setUp(self) -> None:
-        super().setUp()
-        with open(self.shared_datadir / "test_gcp_responses.json") as f:
-            self.data = json.load(f)
-        self.settings = Settings(
-            **self.default_settings,
-            secrets_dir=str(self.shared_datadir),
-        )
-        test_creds = self.data["TEST_CREDS"]
-        # Ensure the service account json file exists
-        test_creds["service_account_json_file"] = test_creds[
-            "service_account_json_file"
-        ]
-        test_gcp_settings = GcpSpecificSettings.from_dict(test_creds)
-        self.settings.providers[ProviderEnum.GCP] = {
-            test_gcp_settings.get_provider_key(): test_gcp_settings
-        }
-        self.connector = GcpCloudConnector(self.settings)
+    data: dict
+
+    @pytest.fixture(autouse=True)
+    def __setup_connector(
+        self,
+        gcp_responses: dict,
+        gcp_base_settings: Settings,
+        gcp_settings: GcpSpecificSettings,
+        gcp_connector: GcpCloudConnector,
+        gcp_credentials: MagicMock,
+    ):
+        """Binds a fresh connector with the state scan() would set up.
+
+        The responses and settings are shared across tests, so tests must
+        copy (not modify) them.
+        """
+        self.data = gcp_responses
+        self.settings = gcp_base_settings
+        self.connector = gcp_connector
         self.connector.organization_id = self.data["TEST_CREDS"]["organization_id"]
-        self.connector.credentials = self.mocker.MagicMock()
-        self.connector.provider_settings = test_gcp_settings
+        self.connector.credentials = gcp_credentials
+        self.connector.provider_settings = gcp_settings
         self.connector.all_projects = {}
         self.connector.found_projects = set()
 
-    # def tearDown(self) -> None:
-    #     # Reset the deaultdicts as they are immutable
-    #     for seed_key in list(self.connector.seeds.keys()):
-    #         del self.connector.seeds[seed_key]
-    #     for cloud_asset_key in list(self.connector.cloud_assets.keys()):
-    #         del self.connector.cloud_assets[cloud_asset_key]
-
-    def mock_asset(self, data: dict) -> ResourceSearchResult:
-        """Populate the ResourceSearchResult object.
+    def mock_search_all_resources(
+        self, results: Iterable["ResourceSearchResult"], **attributes: Any
+    ) -> MagicMock:
+        """Mock search_all_resources to return a single page of results.
 
         Args:
-            data (dict): The data to mock.
+            results (Iterable[ResourceSearchResult]): The results to return.
+            **attributes (Any): Other connector attributes to patch with it.
 
         Returns:
-            ResourceSearchResult: The test ResourceSearchResult object.
+            MagicMock: The mocked search_all_resources.
         """
-        return ResourceSearchResult.from_json(json.dumps(data))
-
-    def mock_healthcheck(self) -> MagicMock:
-        """Mock the healthcheck.
-
-        Returns:
-            MagicMock: mocked healthcheck
-        """
-        return self.mocker.patch(
-            "censys.cloud_connectors.gcp_connector.connector.Healthcheck"
+        pager = SearchAllResourcesPager(
+            response=SearchAllResourcesResponse(results=results),
+            request={},
+            method=None,
         )
+        mock_search_all_resources = MagicMock(return_value=pager)
+        self.mocker.patch.multiple(
+            self.connector,
+            search_all_resources=mock_search_all_resources,
+            **attributes,
+        )
+        return mock_search_all_resources
 
     def test_init(self):
         assert self.connector.provider == ProviderEnum.GCP
         assert self.connector.label_prefix == "GCP: "
-        assert self.connector.settings == self.settings
+        assert self.connector.settings is self.settings
+
+    def test_search_all_resources(self, mock_cai_client: MagicMock):
+        # Test data
+        test_filter = "test-filter"
 
-    @parameterized.expand([("test-filter")])
-    def test_search_all_resources(self, filter: str):
         # Mock
-        mock_cloud_asset_client = self.mocker.patch(
-            "censys.cloud_connectors.gcp_connector.connector.AssetServiceClient"
-        )
-        self.connector.cloud_asset_client = mock_cloud_asset_client.return_value
+        self.connector.cloud_asset_client = mock_cai_client.return_value
 
         # Actual call
-        self.connector.search_all_resources(filter)
+        self.connector.search_all_resources(test_filter)
 
         # Assertions
-        mock_cloud_asset_client.return_value.search_all_resources.assert_called_once_with(
+        mock_cai_client.return_value.search_all_resources.assert_called_once_with(
             request={
                 "scope": f"organizations/{self.connector.organization_id}",
-                "asset_types": [filter],
+                "asset_types": [test_filter],
                 "read_mask": "*",
             }
         )
 
-    def test_scan(self):
-        # Mock
-        mock_credentials = self.mocker.patch(
-            "censys.cloud_connectors.gcp_connector.connector.service_account.Credentials.from_service_account_file",
-        )
-        mock_cai_client = self.mocker.patch(
-            "censys.cloud_connectors.gcp_connector.connector.AssetServiceClient"
-        )
-        mock_scan = self.mocker.patch.object(
-            self.connector.__class__.__bases__[0], "scan"
-        )
-        mock_healthcheck = self.mock_healthcheck()
-
+    def test_scan(self, gcp_patches: SimpleNamespace, mock_cai_client: MagicMock):
         # Actual call
         self.connector.scan()
 
         # Assertions
-        mock_credentials.assert_called_once()
+        gcp_patches.credentials.assert_called_once()
         mock_cai_client.assert_called_once()
-        mock_scan.assert_called_once()
-        self.assert_healthcheck_called(mock_healthcheck)
+        gcp_patches.base_scan.assert_called_once()
+        self.assert_healthcheck_called(gcp_patches.healthcheck)
 
-    def test_credentials_fail(self):
+    def test_credentials_fail(self, gcp_patches: SimpleNamespace):
         # Mock
-        mock_credentials = self.mocker.patch(
-            "censys.cloud_connectors.gcp_connector.connector.service_account.Credentials.from_service_account_file",
-            side_effect=ValueError,
-        )
+        gcp_patches.credentials.side_effect = ValueError
         mock_error_logger = self.mocker.patch.object(self.connector.logger, "error")
-        mock_scan = self.mocker.patch.object(
-            self.connector.__class__.__bases__[0], "scan"
-        )
-        mock_healthcheck = self.mock_healthcheck()
 
         # Actual call
         self.connector.scan()
 
         # Assertions
-        mock_credentials.assert_called_once()
+        gcp_patches.credentials.assert_called_once()
         mock_error_logger.assert_called()
-        mock_scan.assert_not_called()
-        self.assert_healthcheck_called(mock_healthcheck)
+        gcp_patches.base_scan.assert_not_called()
+        self.assert_healthcheck_called(gcp_patches.healthcheck)
 
-    def test_scan_all(self):
-        # Test data
-        test_creds = self.data["TEST_CREDS"]
-        second_test_creds = test_creds
-        second_test_creds["organization_id"] = 987654321012
+    def test_scan_all(self, gcp_settings: GcpSpecificSettings):
+        # Test data (copy so the shared settings stay untouched)
         test_gcp_settings = [
-            GcpSpecificSettings.from_dict(test_creds),
-            GcpSpecificSettings.from_dict(second_test_creds),
+            gcp_settings,
+            gcp_settings.copy(update={"organization_id": 987654321012}),
         ]
         provider_settings: dict[tuple, GcpSpecificSettings] = {
             p.get_provider_key(): p for p in test_gcp_settings
         }
-        self.connector.settings.providers[self.connector.provider] = provider_settings
+        self.mocker.patch.dict(
+            self.connector.settings.providers,
+            {self.connector.provider: provider_settings},
+        )
 
         # Mock
         mock_scan = self.mocker.patch.object(self.connector, "scan")
@@ -173,44 +338,35 @@ class TestGcpConnector(BaseConnectorCase, TestCase):
         # Assertions
         assert mock_scan.call_count == len(provider_settings)
 
-    @parameterized.expand(
-        [
-            ("my-cc-test-project"),
-        ]
-    )
-    def test_format_label(self, test_project_id: str):
-        # Actual call
-        label = self.connector.format_label(test_project_id)
+    def test_format_label(self):
+        # Test data
+        test_project_id = "my-cc-test-project"
+        expected_label = "GCP: 111222333444/my-cc-test-project"
 
         # Assertions
-        assert label == f"GCP: {self.connector.organization_id}/{test_project_id}"
+        assert self.connector.format_label(test_project_id) == expected_label
 
     def test_list_projects(self):
         # Test data
+        test_project_map: dict[str, dict] = {
+            f"111111111111{i}": {
+                "project_id": f"test_project{i}",
+                "name": f"Test Project{i}",
+            }
+            for i in range(3)
+        }
         test_projects = []
-        test_project_map: dict[str, dict] = {}
-        for i in range(3):
-            test_project = self.data["TEST_PROJECT"]
-            project_id = "test_project" + str(i)
-            project_number = "111111111111" + str(i)
-            name = "Test Project" + str(i)
-            test_project["versioned_resources"][0]["resource"]["projectId"] = project_id
-            test_project["versioned_resources"][0]["resource"][
-                "projectNumber"
-            ] = project_number
-            test_project["versioned_resources"][0]["resource"]["name"] = name
-            test_projects.append(self.mock_asset(test_project))
-            test_project_map[project_number] = {"project_id": project_id, "name": name}
+        for project_number, project in test_project_map.items():
+            test_project = copy.deepcopy(self.data["TEST_PROJECT"])
+            test_project["versioned_resources"][0]["resource"].update(
+                projectId=project["project_id"],
+                projectNumber=project_number,
+                name=project["name"],
+            )
+            test_projects.append(parse_asset(test_project))
 
         # Mock
-        mock_pager = SearchAllResourcesPager(
-            response=SearchAllResourcesResponse(results=test_projects),
-            request={},
-            method=None,
-        )
-        mock_search_all_resources = self.mocker.patch.object(
-            self.connector, "search_all_resources", return_value=mock_pager
-        )
+        mock_search_all_resources = self.mock_search_all_resources(test_projects)
 
         # Actual call
         all_projects = self.connector.list_projects()
@@ -227,180 +383,58 @@ class TestGcpConnector(BaseConnectorCase, TestCase):
             )
             assert project["name"] == test_project_map[project_number]["name"]
 
-    def test_get_compute_instances(self):
-        # self.skipTest("Test data is not available yet")
-        # Test data
-        test_assets = []
-        test_seed_values = []
-        test_all_projects = {
-            "123456789123": {
-                "project_id": "censys-cc-test-project",
-                "name": "Censys CC Test Project",
-            }
-        }
-        for i in range(3):
-            test_asset = self.data["TEST_COMPUTE_INSTANCE"]
-            network_interfaces = test_asset["versioned_resources"][0]["resource"][
-                "networkInterfaces"
-            ]
-            access_configs = network_interfaces[0]["accessConfigs"]
-            ip_address = access_configs[0]["natIP"]
-            ip_address = ip_address[:-1] + str(i)
-            access_configs[0]["natIP"] = ip_address
-            access_configs[0]["name"] = "External NAT"
-            network_interfaces[0]["accessConfigs"] = access_configs
-            test_asset["versioned_resources"][0]["resource"][
-                "networkInterfaces"
-            ] = network_interfaces
-            test_seed_values.append(ip_address)
-            test_assets.append(self.mock_asset(test_asset))
-
-        test_label = self.connector.format_label("censys-cc-test-project")
-
-        # Mock
-        mock_pager = SearchAllResourcesPager(
-            response=SearchAllResourcesResponse(results=test_assets),
-            request={},
-            method=None,
-        )
-        mock_search_all_resources = self.mocker.patch.object(
-            self.connector, "search_all_resources", return_value=mock_pager
-        )
-        self.mocker.patch.object(self.connector, "all_projects", test_all_projects)
-
-        # Actual call
-        self.connector.get_compute_instances()
-
-        # Assertions
-        mock_search_all_resources.assert_called_once_with(
-            filter=GcpCloudAssetInventoryTypes.COMPUTE_INSTANCE
-        )
-        self.assert_seeds_with_values(
-            self.connector.seeds[test_label], test_seed_values
-        )
-
-    def test_get_compute_addresses(self):
-        # Test data
-        test_assets = []
-        test_seed_values = []
-        test_all_projects = {
-            "123456789123": {
-                "project_id": "censys-cc-test-project",
-                "name": "Censys CC Test Project",
-            }
-        }
-        for i in range(3):
-            test_asset = self.data["TEST_COMPUTE_ADDRESS"]
-            ip_address = test_asset["versioned_resources"][0]["resource"]["address"]
-            ip_address = ip_address[:-1] + str(i)
-            test_asset["versioned_resources"][0]["resource"]["address"] = ip_address
-            test_seed_values.append(ip_address)
-            test_assets.append(self.mock_asset(test_asset))
-        test_label = self.connector.format_label("censys-cc-test-project")
-
-        # Mock
-        mock_pager = SearchAllResourcesPager(
-            response=SearchAllResourcesResponse(results=test_assets),
-            request={},
-            method=None,
-        )
-        mock_search_all_resources = self.mocker.patch.object(
-            self.connector, "search_all_resources", return_value=mock_pager
-        )
-        self.mocker.patch.object(self.connector, "all_projects", test_all_projects)
-
-        # Actual call
-        self.connector.get_compute_addresses()
-
-        # Assertions
-        mock_search_all_resources.assert_called_once_with(
-            filter=GcpCloudAssetInventoryTypes.COMPUTE_ADDRESS
-        )
-        self.assert_seeds_with_values(
-            self.connector.seeds[test_label], test_seed_values
-        )
-
-    def test_get_container_clusters(self):
+    @pytest.mark.parametrize(
+        ("getter", "resource_type", "data_key", "field_path", "field_values"),
+        SEED_ASSET_CASES,
+    )
+    def test_get_seed_assets(
+        self,
+        getter: str,
+        resource_type: GcpCloudAssetInventoryTypes,
+        data_key: str,
+        field_path: str,
+        field_values: tuple[str, ...],
+    ):
         # Test data
-        test_assets = []
-        test_seed_values = []
-        test_all_projects = {
-            "123456789123": {
-                "project_id": "censys-cc-test-project",
-                "name": "Censys CC Test Project",
-            }
-        }
-        for i in range(3):
-            test_asset = self.data["TEST_CONTAINER_CLUSTER"]
-            private_cluster_config = test_asset["versioned_resources"][0]["resource"][
-                "privateClusterConfig"
-            ]
-            ip_address = private_cluster_config["publicEndpoint"]
-            ip_address = ip_address[:-1] + str(i)
-            private_cluster_config["publicEndpoint"] = ip_address
-            test_asset["versioned_resources"][0]["resource"][
-                "privateClusterConfig"
-            ] = private_cluster_config
-            test_seed_values.append(ip_address)
-            test_assets.append(self.mock_asset(test_asset))
-        test_label = self.connector.format_label("censys-cc-test-project")
+        test_assets = [
+            build_asset(self.data[data_key], field_path, value)
+            for value in field_values
+        ]
+        # Seeds are recorded without the trailing dot of DNS names
+        test_seed_values = [value.removesuffix(".") for value in field_values]
 
         # Mock
-        mock_pager = SearchAllResourcesPager(
-            response=SearchAllResourcesResponse(results=test_assets),
-            request={},
-            method=None,
-        )
-        mock_search_all_resources = self.mocker.patch.object(
-            self.connector, "search_all_resources", return_value=mock_pager
+        mock_search_all_resources = self.mock_search_all_resources(
+            test_assets, all_projects=TEST_ALL_PROJECTS
         )
-        self.mocker.patch.object(self.connector, "all_projects", test_all_projects)
 
         # Actual call
-        self.connector.get_container_clusters()
+        getattr(self.connector, getter)()
 
         # Assertions
-        mock_search_all_resources.assert_called_once_with(
-            filter=GcpCloudAssetInventoryTypes.CONTAINER_CLUSTER
-        )
+        mock_search_all_resources.assert_called_once_with(filter=resource_type)
         self.assert_seeds_with_values(
-            self.connector.seeds[test_label], test_seed_values
+            self.connector.seeds[TEST_LABEL], test_seed_values
         )
 
     def test_get_cloud_sql_instances(self):
         # Test data
-        test_assets = []
-        test_seed_values = []
-        test_all_projects = {
-            "123456789123": {
-                "project_id": "censys-cc-test-project",
-                "name": "Censys CC Test Project",
-            }
-        }
-        for i in range(1, 4):
-            test_asset = self.data["TEST_CLOUD_SQL_INSTANCE"]
-            ip_addresses: list[dict] = []
-            # populate ip_addresses.ipAddress with i number of ips
-            for j in range(i):
-                ip_address = f"195.111.{i}.{j}"
-                ip_addresses.append({"ipAddress": ip_address})
-                test_seed_values.append(ip_address)
-            test_asset["versioned_resources"][0]["resource"][
-                "ipAddresses"
-            ] = ip_addresses
-            test_assets.append(self.mock_asset(test_asset))
-        test_label = self.connector.format_label("censys-cc-test-project")
+        # Instance i has i ip addresses
+        test_ip_groups = [[f"195.111.{i}.{j}" for j in range(i)] for i in range(1, 4)]
+        test_seed_values = [ip for ips in test_ip_groups for ip in ips]
+        test_assets = [
+            build_asset(
+                self.data["TEST_CLOUD_SQL_INSTANCE"],
+                "ipAddresses",
+                [{"ipAddress": ip} for ip in ips],
+            )
+            for ips in test_ip_groups
+        ]
 
         # Mock
-        mock_pager = SearchAllResourcesPager(
-            response=SearchAllResourcesResponse(results=test_assets),
-            request={},
-            method=None,
-        )
-        mock_search_all_resources = self.mocker.patch.object(
-            self.connector, "search_all_resources", return_value=mock_pager
+        mock_search_all_resources = self.mock_search_all_resources(
+            test_assets, all_projects=TEST_ALL_PROJECTS
         )
-        self.mocker.patch.object(self.connector, "all_projects", test_all_projects)
 
         # Actual call
         self.connector.get_cloud_sql_instances()
@@ -410,138 +444,46 @@ class TestGcpConnector(BaseConnectorCase, TestCase):
             filter=GcpCloudAssetInventoryTypes.CLOUD_SQL_INSTANCE
         )
         self.assert_seeds_with_values(
-            self.connector.seeds[test_label], test_seed_values
-        )
-
-    def test_get_dns_records(self):
-        # Test data
-        test_assets = []
-        test_seed_values = []
-        test_all_projects = {
-            "123456789123": {
-                "project_id": "censys-cc-test-project",
-                "name": "Censys CC Test Project",
-            }
-        }
-        for i in range(3):
-            test_asset = self.data["TEST_DNS_ZONE"]
-            domain = str(i) + "." + "censys.io"
-            test_asset["versioned_resources"][0]["resource"]["dnsName"] = domain + "."
-            test_seed_values.append(domain)
-            test_assets.append(self.mock_asset(test_asset))
-        test_label = self.connector.format_label("censys-cc-test-project")
-
-        # Mock
-        mock_pager = SearchAllResourcesPager(
-            response=SearchAllResourcesResponse(results=test_assets),
-            request={},
-            method=None,
-        )
-        mock_search_all_resources = self.mocker.patch.object(
-            self.connector, "search_all_resources", return_value=mock_pager
-        )
-        self.mocker.patch.object(self.connector, "all_projects", test_all_projects)
-
-        # Actual call
-        self.connector.get_dns_records()
-
-        # Assertions
-        mock_search_all_resources.assert_called_once_with(
-            filter=GcpCloudAssetInventoryTypes.DNS_ZONE
-        )
-        self.assert_seeds_with_values(
-            self.connector.seeds[test_label], test_seed_values
-        )
-
-    def test_get_seeds(self):
-        # Test data
-        self.connector.provider_settings = GcpSpecificSettings.from_dict(
-            self.data["TEST_CREDS"]
-        )
-
-        seed_scanners = {
-            GcpCloudAssetInventoryTypes.COMPUTE_INSTANCE: self.mocker.Mock(),
-            GcpCloudAssetInventoryTypes.COMPUTE_ADDRESS: self.mocker.Mock(),
-            GcpCloudAssetInventoryTypes.CONTAINER_CLUSTER: self.mocker.Mock(),
-            GcpCloudAssetInventoryTypes.CLOUD_SQL_INSTANCE: self.mocker.Mock(),
-            GcpCloudAssetInventoryTypes.DNS_ZONE: self.mocker.Mock(),
-        }
-
-        # Mock
-        self.mocker.patch.object(
-            self.connector,
-            "seed_scanners",
-            new_callable=self.mocker.PropertyMock(return_value=seed_scanners),
+            self.connector.seeds[TEST_LABEL], test_seed_values
         )
 
-        # Actual call
-        self.connector.get_seeds()
-
-        # Assertions
-        for mock in self.connector.seed_scanners.values():
-            mock.assert_called_once()
-
-    def test_get_seeds_ignore(self):
+    @pytest.mark.parametrize(
+        ("gcp_provider_settings", "expected_ignored"),
+        IGNORE_CASES,
+        indirect=["gcp_provider_settings"],
+    )
+    def test_get_seeds(
+        self,
+        gcp_provider_settings: GcpSpecificSettings,
+        expected_ignored: set[GcpCloudAssetInventoryTypes],
+        seed_scanners: dict[str, Mock],
+    ):
         # Test data
-        self.connector.provider_settings = GcpSpecificSettings.from_dict(
-            self.data["TEST_CREDS_IGNORE"]
-        )
-
-        seed_scanners = {
-            GcpCloudAssetInventoryTypes.COMPUTE_INSTANCE: self.mocker.Mock(),
-            GcpCloudAssetInventoryTypes.COMPUTE_ADDRESS: self.mocker.Mock(),
-            GcpCloudAssetInventoryTypes.CONTAINER_CLUSTER: self.mocker.Mock(),
-            GcpCloudAssetInventoryTypes.CLOUD_SQL_INSTANCE: self.mocker.Mock(),
-            GcpCloudAssetInventoryTypes.DNS_ZONE: self.mocker.Mock(),
-        }
-
-        # Mock
-        self.mocker.patch.object(
-            self.connector,
-            "seed_scanners",
-            new_callable=self.mocker.PropertyMock(return_value=seed_scanners),
-        )
+        self.connector.provider_settings = gcp_provider_settings
 
         # Actual call
         self.connector.get_seeds()
 
         # Assertions
-        for resource_type, mock in self.connector.seed_scanners.items():
-            if resource_type in self.connector.provider_settings.ignore:
+        for resource_type, mock in seed_scanners.items():
+            if resource_type in expected_ignored:
                 mock.assert_not_called()
             else:
                 mock.assert_called_once()
 
     def test_get_storage_buckets(self):
         # Test data
-        test_assets = []
-        test_buckets = []
-        test_all_projects = {
-            "123456789123": {
-                "project_id": "censys-cc-test-project",
-                "name": "Censys CC Test Project",
-            }
-        }
-        for i in range(3):
-            test_asset = self.data["TEST_STORAGE_BUCKET"]
-            bucket_name = "bucket" + str(i)
-            test_asset["versioned_resources"][0]["resource"]["id"] = bucket_name
-            test_buckets.append(bucket_name)
-            test_assets.append(self.mock_asset(test_asset))
-        test_uid = self.connector.format_uid("censys-cc-test-project")
+        test_buckets = [f"bucket{i}" for i in range(3)]
+        test_assets = [
+            build_asset(self.data["TEST_STORAGE_BUCKET"], "id", bucket)
+            for bucket in test_buckets
+        ]
 
         # Mock
-        mock_pager = SearchAllResourcesPager(
-            response=SearchAllResourcesResponse(results=test_assets),
-            request={},
-            method=None,
-        )
-        mock_search_all_resources = self.mocker.patch.object(
-            self.connector, "search_all_resources", return_value=mock_pager
+        mock_search_all_resources = self.mock_search_all_resources(
+            test_assets, all_projects=TEST_ALL_PROJECTS
         )
 
-        self.mocker.patch.object(self.connector, "all_projects", test_all_projects)
-
         # Actual call
         self.connector.get_storage_buckets()
 
@@ -549,8 +491,8 @@ class TestGcpConnector(BaseConnectorCase, TestCase):
         mock_search_all_resources.assert_called_once_with(
             filter=GcpCloudAssetInventoryTypes.STORAGE_BUCKET
         )
-        assert len(self.connector.cloud_assets[test_uid]) == len(test_buckets)
-        for bucket in self.connector.cloud_assets[test_uid]:
+        assert len(self.connector.cloud_assets[TEST_LABEL]) == len(test_buckets)
+        for bucket in self.connector.cloud_assets[TEST_LABEL]:
             assert "https://storage.googleapis.com/" in bucket.value
             assert (
                 bucket.value.removeprefix("https://storage.googleapis.com/")
@@ -558,43 +500,26 @@ class TestGcpConnector(BaseConnectorCase, TestCase):
             )
             assert "accountNumber" in bucket.scan_data
 
-    def test_get_cloud_assets(self):
-        # Test data
-        self.connector.provider_settings = GcpSpecificSettings.from_dict(
-            self.data["TEST_CREDS"]
-        )
-        cloud_asset_scanners = {
-            GcpCloudAssetInventoryTypes.STORAGE_BUCKET: self.mocker.Mock(),
-        }
-
-        # Mock
-        self.mocker.patch.object(
-            self.connector,
-            "cloud_asset_scanners",
-            new_callable=self.mocker.PropertyMock(return_value=cloud_asset_scanners),
-        )
-
-        # Actual call
-        self.connector.get_cloud_assets()
-
-        # Assertions
-        for mock in cloud_asset_scanners.values():
-            mock.assert_called_once()
-
-    def test_get_cloud_assets_ignore(self):
+    @pytest.mark.parametrize(
+        ("gcp_provider_settings", "expected_ignored"),
+        IGNORE_CASES,
+        indirect=["gcp_provider_settings"],
+    )
+    def test_get_cloud_assets(
+        self,
+        gcp_provider_settings: GcpSpecificSettings,
+        expected_ignored: set[GcpCloudAssetInventoryTypes],
+        cloud_asset_scanners: dict[str, Mock],
+    ):
         # Test data
-        self.connector.provider_settings = GcpSpecificSettings.from_dict(
-            self.data["TEST_CREDS_IGNORE"]
-        )
-
-        # Mock
-        mock_storage_bucket = self.mocker.patch.object(
-            self.connector,
-            "get_storage_buckets",
-        )
+        self.connector.provider_settings = gcp_provider_settings
 
         # Actual call
         self.connector.get_cloud_assets()
 
         # Assertions
-        mock_storage_bucket.assert_not_called()
+        for resource_type, mock in cloud_asset_scanners.items():
+            if resource_type in expected_ignored:
+                mock.assert_not_called()
+            else:
+                mock.assert_called_once()
@@ -29,11 +29,11 @@ class TestGcpProviderSetup(BaseCase, TestCase):
 
     def setUp(self):
         super().setUp()
-        with open(self.shared_datadir / "test_gcp_cli_responses.json") as f:
+        with open(self.data_dir / "test_gcp_cli_responses.json") as f:
             self.data = json.load(f)
         self.settings = Settings(
             **self.default_settings,
-            secrets_dir=str(self.shared_datadir),
+            secrets_dir=str(self.data_dir),
         )
         self.setup_cli = __provider_setup__(self.settings)
 
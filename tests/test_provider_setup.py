@@ -244,7 +244,7 @@ class TestProviderSetupCli(BaseCase, TestCase):
             "float_6_with_field": 10.0,
         }
         expected_other_fields = {
-            "file_path": self.shared_datadir / "default_settings.json",
+            "file_path": self.data_dir / "default_settings.json",
         }
         expected_field_values = (
             expected_str_fields
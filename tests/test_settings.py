@@ -16,14 +16,12 @@ class TestSettings(BaseCase, TestCase):
         super().setUp()
         self.settings = Settings(
             **self.default_settings,
-            secrets_dir=str(self.shared_datadir),
+            secrets_dir=str(self.data_dir),
         )
 
     def test_read_providers_config_file_empty(self):
         temp_providers = self.settings.providers.copy()
-        self.settings.providers_config_file = (
-            self.shared_datadir / "test_empty_providers.yml"
-        )
+        self.settings.providers_config_file = self.data_dir / "test_empty_providers.yml"
         self.settings.read_providers_config_file()
         assert self.settings.providers == temp_providers
 
@@ -33,7 +31,7 @@ class TestSettings(BaseCase, TestCase):
         ]
     )
     def test_read_providers_config_file(self, provider, file_name, expected_count):
-        self.settings.providers_config_file = self.shared_datadir / file_name
+        self.settings.providers_config_file = self.data_dir / file_name
         self.settings.read_providers_config_file([provider])
         assert len(self.settings.providers[provider]) == expected_count
 
@@ -47,7 +45,7 @@ class TestSettings(BaseCase, TestCase):
     def test_read_providers_config_file_provider_option(
         self, provider, file_name, expected_count
     ):
-        self.settings.providers_config_file = self.shared_datadir / file_name
+        self.settings.providers_config_file = self.data_dir / file_name
         self.settings.read_providers_config_file([provider])
         assert len(self.settings.providers[provider]) == expected_count
 
@@ -67,13 +65,13 @@ class TestSettings(BaseCase, TestCase):
         ]
     )
     def test_read_providers_config_file_fail(self, file_name, exec, error_msg):
-        self.settings.providers_config_file = self.shared_datadir / file_name
+        self.settings.providers_config_file = self.data_dir / file_name
         with pytest.raises(exec, match=error_msg):
             self.settings.read_providers_config_file()
 
     @parameterized.expand(["test_azure_providers.yml"])
     def test_write_providers_config_file(self, file_name):
-        original_file = self.shared_datadir / file_name
+        original_file = self.data_dir / file_name
         self.settings.providers_config_file = original_file
         self.settings.read_providers_config_file()
 
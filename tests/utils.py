@@ -1,5 +1,9 @@
+from pathlib import Path
+
 import yaml
 
+DATA_DIR = Path(__file__).parent / "data"
+
 
 def assert_same_yaml(file_a: str, file_b: str):
     """Assert that two yaml files are the same.